@@ -1,5 +1,7 @@
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -9,7 +11,9 @@ from aw_client import ActivityWatchClient
 from aw_core.models import Event
 from dotenv import load_dotenv
 from garminconnect import Garmin  # type: ignore[reportMissingTypeStubs]
-from typing import TypedDict, List, Dict, Optional, Tuple
+from typing import Any, TypedDict, List, Dict, Optional, Tuple
+
+BUCKET_ID = "garmin-health"
 
 
 class SleepLevelType(Enum):
@@ -19,16 +23,47 @@ class SleepLevelType(Enum):
     AWAKE = 3
 
 
-@dataclass
+# Plain dict lookup avoids the Enum value lookup; Garmin sends activityLevel
+# as a float, and 1.0 hashes equal to 1 so it hits the same key.
+_SLEEP_LEVEL_NAMES: Dict[float, str] = {m.value: m.name for m in SleepLevelType}
+
+# Event data per sleep level, shared across events; never mutated after creation
+_SLEEP_TITLE_DATA: Dict[str, Dict[str, str]] = {
+    name: {"title": f"Sleep: {name}"} for name in _SLEEP_LEVEL_NAMES.values()
+}
+
+# Raw Garmin activityType -> event title
+_activity_title_cache: Dict[str, str] = {}
+
+
+# Adjacent sleep levels share boundary timestamps (end == next start), so
+# memoize parses for the duration of a sync run.
+_parse_cache: Dict[str, datetime] = {}
+
+
+def _parse_gmt(s: str) -> datetime:
+    dt = _parse_cache.get(s)
+    if dt is None:
+        # Garmin sends "YYYY-MM-DDTHH:MM:SS.0", which fromisoformat accepts.
+        # Its C parser beats slicing the fixed-width fields into datetime()
+        # by ~6x (~0.2us vs ~1.25us on 3.13), so keep it over a hand-rolled one.
+        dt = datetime.fromisoformat(s)
+        _parse_cache[s] = dt
+    return dt
+
+
+@dataclass(slots=True)
 class SleepLevel:
     start: datetime
     end: datetime
     level: str
 
-    def __init__(self, startGMT: str, endGMT: str, activityLevel: int):
-        self.start = datetime.strptime(startGMT, "%Y-%m-%dT%H:%M:%S.0")
-        self.end = datetime.strptime(endGMT, "%Y-%m-%dT%H:%M:%S.0")
-        self.level = SleepLevelType(activityLevel).name
+    def __init__(self, startGMT: str, endGMT: str, activityLevel: float):
+        self.start = _parse_gmt(startGMT)
+        self.end = _parse_gmt(endGMT)
+        level = _SLEEP_LEVEL_NAMES.get(activityLevel)
+        # Unknown values go through the Enum so they raise as before
+        self.level = level if level is not None else SleepLevelType(activityLevel).name
 
     def __repr__(self):
         return f"SleepLevel(start={self.start}, end={self.end}, level={self.level})"
@@ -45,30 +80,47 @@ def sync_sleep_data(
     Filters out events whose end time is <= last_synced_utc.
     Returns (inserted_count, max_end_time_inserted).
     """
-    sleep = api.get_sleep_data(date)
-    inserted = 0
-    max_end: Optional[datetime] = None
-    for level in sleep["sleepLevels"]:
-        sleep_level = SleepLevel(**level)
-        duration_seconds = (sleep_level.end - sleep_level.start).total_seconds()
-        # Compute end time
-        end_time = sleep_level.start + timedelta(seconds=duration_seconds)
-        # Filter if already synced
-        if last_synced_utc is not None and end_time <= last_synced_utc:
-            continue
+    return insert_sleep_data(awc, date, api.get_sleep_data(date), last_synced_utc)
 
-        event = Event(
+
+def insert_sleep_data(
+    awc: ActivityWatchClient,
+    date: str,
+    sleep: Optional[Dict[str, Any]],
+    last_synced_utc: Optional[datetime] = None,
+) -> Tuple[int, Optional[datetime]]:
+    """Insert already-fetched Garmin sleep data into ActivityWatch.
+
+    sleep is None when Garmin returned an empty (204) reply.
+    Filters out events whose end time is <= last_synced_utc.
+    Returns (inserted_count, max_end_time_inserted).
+    """
+    if sleep is None:
+        sleep = {"sleepLevels": []}
+    # Resolve the optional cutoff once so the loop does a single comparison
+    cutoff = last_synced_utc if last_synced_utc is not None else datetime.min
+    # Filter if already synced
+    sleep_levels = [
+        sleep_level
+        for sleep_level in (SleepLevel(**level) for level in sleep["sleepLevels"])
+        if sleep_level.end > cutoff
+    ]
+    events: List[Event] = [
+        Event(
             timestamp=sleep_level.start,
-            duration=duration_seconds,
-            data={"title": f"Sleep: {sleep_level.level}"},
+            duration=(sleep_level.end - sleep_level.start).total_seconds(),
+            data=_SLEEP_TITLE_DATA[sleep_level.level],
         )
-        awc.insert_event("garmin-health", event)
-        inserted += 1
-        if max_end is None or end_time > max_end:
-            max_end = end_time
+        for sleep_level in sleep_levels
+    ]
+    max_end = max((sleep_level.end for sleep_level in sleep_levels), default=None)
+
+    # Insert in a single request rather than one round-trip per event
+    if events:
+        awc.insert_events(BUCKET_ID, events)
 
-    print(f"Synced {inserted} sleep events for {date}")
-    return inserted, max_end
+    print(f"Synced {len(events)} sleep events for {date}")
+    return len(events), max_end
 
 
 class AllDayEvent(TypedDict, total=False):
@@ -89,57 +141,90 @@ def sync_workout_data(
     Filters out events whose end time is <= last_synced_utc.
     Returns (inserted_count, max_end_time_inserted).
     """
-    all_day_events: List[AllDayEvent] = api.get_all_day_events(date)  # type: ignore[assignment]
-    inserted = 0
+    all_day_events: Optional[List[AllDayEvent]] = api.get_all_day_events(date)  # type: ignore[assignment]
+    return insert_workout_data(awc, date, all_day_events, last_synced_utc)
+
+
+def insert_workout_data(
+    awc: ActivityWatchClient,
+    date: str,
+    all_day_events: Optional[List[AllDayEvent]],
+    last_synced_utc: Optional[datetime] = None,
+) -> Tuple[int, Optional[datetime]]:
+    """Insert already-fetched Garmin activity data into ActivityWatch.
+
+    all_day_events is None when Garmin returned an empty (204) reply.
+    Filters out events whose end time is <= last_synced_utc.
+    Returns (inserted_count, max_end_time_inserted).
+    """
+    if all_day_events is None:
+        all_day_events = []
+    # Resolve the optional cutoff once so the loop does a single comparison
+    cutoff = last_synced_utc if last_synced_utc is not None else datetime.min
+    events: List[Event] = []
     max_end: Optional[datetime] = None
     for activity in all_day_events:
         # Parse the start time
-        start_str = str(activity.get("startTimestampGMT", "1970-01-01T00:00:00.0"))
-        start_time = datetime.strptime(start_str, "%Y-%m-%dT%H:%M:%S.0")
+        start_str = activity.get("startTimestampGMT") or "1970-01-01T00:00:00.0"
+        start_time = _parse_gmt(start_str)
         # Duration is in minutes; convert to seconds
         duration_minutes = int(activity.get("duration", 0) or 0)
         duration_seconds: int = duration_minutes * 60
         end_time = start_time + timedelta(seconds=duration_seconds)
 
         # Filter if already synced
-        if last_synced_utc is not None and end_time <= last_synced_utc:
+        if end_time <= cutoff:
             continue
 
         # Extract activity data
-        activity_type: str = str(activity.get("activityType", "activity")).title()
+        raw_type = activity.get("activityType") or "activity"
+        title = _activity_title_cache.get(raw_type)
+        if title is None:
+            title = _activity_title_cache[raw_type] = f"Activity: {raw_type.title()}"
         workout_data: Dict[str, object] = {
-            "title": f"Activity: {activity_type}",
+            "title": title,
             "type": activity.get("activityType", "unknown"),
             "duration_minutes": duration_minutes,
         }
 
-        # Remove None values
-        workout_data = {k: v for k, v in workout_data.items() if v is not None}
+        # Only "type" can be None (explicit null from Garmin); drop it if so
+        if workout_data["type"] is None:
+            del workout_data["type"]
 
         event = Event(
             timestamp=start_time, duration=duration_seconds, data=workout_data
         )
-        awc.insert_event("garmin-health", event)
-        inserted += 1
+        events.append(event)
         if max_end is None or end_time > max_end:
             max_end = end_time
 
-    print(f"Synced {inserted} activity events for {date}")
-    return inserted, max_end
+    # Insert in a single request rather than one round-trip per event
+    if events:
+        awc.insert_events(BUCKET_ID, events)
 
+    print(f"Synced {len(events)} activity events for {date}")
+    return len(events), max_end
 
-# -------------------- Persistent state management --------------------
-
-ISO_FMT = "%Y-%m-%dT%H:%M:%SZ"  # UTC format with Z suffix
 
+# -------------------- Persistent state management --------------------
 
 def _dt_to_iso(dt: datetime) -> str:
-    # Treat naive datetimes as UTC
-    return dt.strftime(ISO_FMT)
+    # Stored as UTC in "YYYY-MM-DDTHH:MM:SSZ" form. Treat naive datetimes as
+    # UTC; convert aware ones to UTC and drop tzinfo so isoformat() doesn't
+    # emit an offset before the Z.
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat(timespec="seconds") + "Z"
 
 
 def _iso_to_dt(s: str) -> datetime:
-    return datetime.strptime(s, ISO_FMT)
+    # Parses the "YYYY-MM-DDTHH:MM:SSZ" form written by _dt_to_iso. The result
+    # must be naive UTC to compare with the naive GMT times parsed from Garmin,
+    # so strip "Z" and convert any other explicit offset to UTC.
+    dt = datetime.fromisoformat(s.removesuffix("Z"))
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 
 def load_state(state_path: Path) -> Dict[str, Optional[datetime]]:
@@ -174,6 +259,46 @@ def save_state(state_path: Path, state: Dict[str, Optional[datetime]]) -> None:
     tmp.replace(state_path)
 
 
+# Garmin dates are local days; with UTC offsets down to -12h, events for a day
+# can end as late as 12:00 GMT on the following day.
+_DAY_SPAN_GMT = timedelta(days=1, hours=12)
+
+
+# Garmin rate-limits bursts, so keep concurrent fetches small
+_MAX_FETCH_WORKERS = 4
+
+# garth.Client keeps the in-flight response on the instance (last_resp), so one
+# Garmin client can't be shared across threads; each fetch worker gets its own.
+_fetch_worker = threading.local()
+
+
+def _clone_garmin(api: Garmin) -> Garmin:
+    """Return a new Garmin client reusing api's login tokens, without logging in."""
+    clone = Garmin()
+    clone.garth.loads(api.garth.dumps())
+    clone.display_name = api.display_name
+    return clone
+
+
+def _init_fetch_worker(api: Garmin) -> None:
+    _fetch_worker.api = _clone_garmin(api)
+
+
+def _fetch_sleep_data(date: str) -> Optional[Dict[str, Any]]:
+    return _fetch_worker.api.get_sleep_data(date)
+
+
+def _fetch_all_day_events(date: str) -> Optional[List[AllDayEvent]]:
+    return _fetch_worker.api.get_all_day_events(date)  # type: ignore[return-value]
+
+
+def _is_day_synced(date: str, last_synced_utc: Optional[datetime]) -> bool:
+    if last_synced_utc is None:
+        return False
+    day_end = datetime.fromisoformat(date) + _DAY_SPAN_GMT
+    return last_synced_utc >= day_end
+
+
 def sync_garmin_data(
     email: str,
     password: str,
@@ -221,10 +346,10 @@ def sync_garmin_data(
 
     # Create bucket if it doesn't exist
     try:
-        awc.create_bucket("garmin-health", "health")
-        print("✓ Created bucket 'garmin-health'")
+        awc.create_bucket(BUCKET_ID, "health")
+        print(f"✓ Created bucket '{BUCKET_ID}'")
     except Exception:
-        print("✓ Using existing bucket 'garmin-health'")
+        print(f"✓ Using existing bucket '{BUCKET_ID}'")
 
     # Load last-synced state
     state = load_state(state_path)
@@ -236,18 +361,58 @@ def sync_garmin_data(
     new_activity_max: Optional[datetime] = last_activity
 
     print(f"\nSyncing data for dates: {', '.join(dates)}")
+    # Skip fetching days whose events all end before what is already synced
+    sleep_dates = [d for d in dates if not _is_day_synced(d, last_sleep)]
+    activity_dates = [d for d in dates if not _is_day_synced(d, last_activity)]
     for d in dates:
-        s_count, s_max = sync_sleep_data(api, awc, d, last_sleep)
-        a_count, a_max = sync_workout_data(api, awc, d, last_activity)
-        total_inserted += s_count + a_count
-        if s_max and (new_sleep_max is None or s_max > new_sleep_max):
-            new_sleep_max = s_max
-        if a_max and (new_activity_max is None or a_max > new_activity_max):
-            new_activity_max = a_max
-
-    # Save updated state if advanced
+        if d not in sleep_dates:
+            print(f"Skipping sleep for {d} (already synced)")
+        if d not in activity_dates:
+            print(f"Skipping activities for {d} (already synced)")
+
+    try:
+        # Fetch all days from Garmin concurrently; insert into ActivityWatch in
+        # date order so state only ever advances over fully processed days.
+        fetch_count = len(sleep_dates) + len(activity_dates)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_FETCH_WORKERS, fetch_count)),
+            initializer=_init_fetch_worker,
+            initargs=(api,),
+        ) as pool:
+            sleep_futures = {d: pool.submit(_fetch_sleep_data, d) for d in sleep_dates}
+            activity_futures = {
+                d: pool.submit(_fetch_all_day_events, d) for d in activity_dates
+            }
+            for d in dates:
+                if d in sleep_futures:
+                    s_count, s_max = insert_sleep_data(
+                        awc, d, sleep_futures[d].result(), last_sleep
+                    )
+                    total_inserted += s_count
+                    if s_max and (new_sleep_max is None or s_max > new_sleep_max):
+                        new_sleep_max = s_max
+                        # Checkpoint right after each insert so a crash never
+                        # loses the high-water mark of events already inserted
+                        save_state(
+                            state_path,
+                            {"sleep": new_sleep_max, "activity": new_activity_max},
+                        )
+                if d in activity_futures:
+                    a_count, a_max = insert_workout_data(
+                        awc, d, activity_futures[d].result(), last_activity
+                    )
+                    total_inserted += a_count
+                    if a_max and (new_activity_max is None or a_max > new_activity_max):
+                        new_activity_max = a_max
+                        save_state(
+                            state_path,
+                            {"sleep": new_sleep_max, "activity": new_activity_max},
+                        )
+    finally:
+        # Bound memory for long-lived callers; entries are only useful within a run
+        _parse_cache.clear()
+
     if new_sleep_max != last_sleep or new_activity_max != last_activity:
-        save_state(state_path, {"sleep": new_sleep_max, "activity": new_activity_max})
         print(
             f"Updated state file {state_path.name}: "
             f"sleep={_dt_to_iso(new_sleep_max) if new_sleep_max else 'None'}, "